@@ -5,12 +5,15 @@
 
 import streamlit as st
 import streamlit.components.v1 as components
-import pandas as pd
-import requests
-import plotly.express as px
-import plotly.graph_objects as go
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date
-import time, threading
+from pathlib import Path
+import gc, html, time, threading
+
+# numpy / plotly / requests are imported lazily inside the functions that
+# need them, so importing this module stays cheap on every rerun.
 
 # ----------------------------
 # Constants
@@ -18,69 +21,49 @@ import time, threading
 COINGECKO = "https://api.coingecko.com/api/v3"
 COIN_ID = "ethereum"
 FASTAPI = "https://fastapiethereum.onrender.com"
+PLOTLY_CONFIG = {"displaylogo": False, "plotlyServerURL": ""}
 
 
 # ----------------------------
 # Theme Injection
 # ----------------------------
+@st.cache_resource
+def _theme_css():
+    """Read the pre-minified student_twinkle.min.css once per process"""
+    return Path(__file__).with_suffix(".min.css").read_text(encoding="utf-8")
+
 def _inject_theme():
-    st.markdown("""
-    <style>
-    :root {
-      --bg: #0B0E11;
-      --panel: #0E1116;
-      --border: #1F2937;
-      --text: #E5E7EB;
-      --muted: #9CA3AF;
-      --gold: #F0B90B;
-    }
-    html, body, [class*="css"] {
-      background-color: var(--bg) !important;
-      color: var(--text) !important;
-      font-family: 'Inter', system-ui, sans-serif !important;
-    }
-    h1, h2, h3, h4 { color: var(--text) !important; font-weight: 600; }
-    a { color: var(--gold) !important; text-decoration: none; }
-    .kpi {
-      background: #111318;
-      border: 1px solid rgba(240,185,11,0.25);
-      border-radius: 14px;
-      padding: 18px;
-      text-align: center;
-    }
-    .kpi h3 {
-      color: var(--muted);
-      font-size: 0.9rem;
-      margin-bottom: 4px;
-    }
-    .kpi p {
-      color: var(--text);
-      font-weight: 700;
-      font-size: 1.4rem;
-      margin: 0;
-    }
-    .divider {
-      height: 1px;
-      background: var(--border);
-      margin: 2rem 0;
-    }
-    .heading-yellow {
-      color: var(--gold);
-      font-size: 1.8rem;
-      font-weight: 700;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(f"<style>{_theme_css()}</style>", unsafe_allow_html=True)
+
+
+# ----------------------------
+# Helper — Shared HTTP Session
+# ----------------------------
+# Set by app/main.py so all student pages share one connection pool
+_HTTP = None
+
+def _session():
+    """The injected shared session, else this module's own pooled one"""
+    return _HTTP if _HTTP is not None else _local_session()
+
+@st.cache_resource
+def _local_session():
+    """One pooled requests.Session per process (keeps TCP+TLS alive)"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+    return s
 
 
 # ----------------------------
 # Helper — API Fetch (Retry)
 # ----------------------------
-def _fetch(url, params=None, retries=3, delay=2):
+def _fetch(url, params=None, retries=3, delay=2, timeout=25):
     """Fetch JSON from API with retry + delay"""
     for attempt in range(retries):
         try:
-            r = requests.get(url, params=params, timeout=25)
+            r = _session().get(url, params=params, timeout=timeout)
             r.raise_for_status()
             return r.json()
         except Exception:
@@ -93,11 +76,13 @@ def _fetch(url, params=None, retries=3, delay=2):
 # ----------------------------
 # Cached API Endpoints
 # ----------------------------
-@st.cache_data(ttl=600)
+# show_spinner=False: these also run in the warm-up thread and pool
+# workers, and app() shows one spinner around the whole batch.
+@st.cache_data(ttl=600, show_spinner=False)
 def get_metadata():
     return _fetch(f"{COINGECKO}/coins/{COIN_ID}")
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def get_live_market():
     params = {
         "ids": COIN_ID,
@@ -108,11 +93,28 @@ def get_live_market():
     }
     return _fetch(f"{COINGECKO}/simple/price", params)
 
-@st.cache_data(ttl=600)
+@st.cache_data(ttl=86400, show_spinner=False)
+def get_prediction(iso_date):
+    # single short attempt: a cold Render instance must not stall the page
+    pred = _fetch(f"{FASTAPI}/predict/ethereum", {"date": iso_date}, retries=1, timeout=10)
+    if pred is None:
+        # raising keeps a failed call out of the day-long cache
+        raise RuntimeError("FastAPI prediction unavailable")
+    return pred
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _prediction_or_none(iso_date):
+    """get_prediction, with failures cached as None for a minute"""
+    try:
+        return get_prediction(iso_date)
+    except RuntimeError:
+        return None
+
+@st.cache_data(ttl=600, show_spinner=False)
 def get_ohlc(days=90):
     return _fetch(f"{COINGECKO}/coins/{COIN_ID}/ohlc", {"vs_currency": "usd", "days": days})
 
-@st.cache_data(ttl=600)
+@st.cache_data(ttl=600, show_spinner=False)
 def get_market_chart(days=90):
     return _fetch(f"{COINGECKO}/coins/{COIN_ID}/market_chart", {"vs_currency": "usd", "days": days})
 
@@ -120,13 +122,45 @@ def get_market_chart(days=90):
 # ----------------------------
 # Visualization Builders
 # ----------------------------
+MAX_POINTS = 300
+
+def _downsample(series, threshold=MAX_POINTS):
+    """Largest-Triangle-Three-Buckets downsampling of [ts, value] pairs"""
+    n = len(series)
+    if n <= threshold or threshold < 3:
+        return series
+    out = [series[0]]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # average of the next bucket is the third triangle vertex
+        nxt_start = int((i + 1) * every) + 1
+        nxt_end = min(int((i + 2) * every) + 1, n)
+        nxt = series[nxt_start:nxt_end]
+        avg_x = sum(p[0] for p in nxt) / len(nxt)
+        avg_y = sum(p[1] for p in nxt) / len(nxt)
+        ax, ay = series[a]
+        best, best_area = None, -1.0
+        for j in range(int(i * every) + 1, nxt_start):
+            bx, by = series[j]
+            area = abs((ax - avg_x) * (by - ay) - (ax - bx) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        out.append(series[best])
+        a = best
+    out.append(series[-1])
+    return out
+
+@st.cache_data(ttl=600)
 def plot_candlestick(ohlc):
     if not ohlc:
         return None
-    df = pd.DataFrame(ohlc, columns=["ts", "open", "high", "low", "close"])
-    df["date"] = pd.to_datetime(df["ts"], unit="ms")
+    import numpy as np
+    import plotly.graph_objects as go
+    arr = np.asarray(ohlc, dtype=np.float64)
+    dates = arr[:, 0].astype(np.int64).astype("datetime64[ms]")
     fig = go.Figure(data=[go.Candlestick(
-        x=df["date"], open=df["open"], high=df["high"], low=df["low"], close=df["close"], name="ETH"
+        x=dates, open=arr[:, 1], high=arr[:, 2], low=arr[:, 3], close=arr[:, 4], name="ETH"
     )])
     fig.update_layout(
         height=420,
@@ -138,14 +172,18 @@ def plot_candlestick(ohlc):
     )
     return fig
 
+@st.cache_data(ttl=600)
 def plot_line(series, label, height=280):
     if not series:
         return None
-    df = pd.DataFrame(series, columns=["ts", "value"])
-    df["date"] = pd.to_datetime(df["ts"], unit="ms")
-    fig = px.line(df, x="date", y="value", labels={"value": label})
+    import numpy as np
+    import plotly.graph_objects as go
+    arr = np.asarray(_downsample(series), dtype=np.float64)
+    dates = arr[:, 0].astype(np.int64).astype("datetime64[ms]")
+    fig = go.Figure(data=[go.Scatter(x=dates, y=arr[:, 1], mode="lines", name=label)])
     fig.update_layout(
         height=height,
+        xaxis_title="date", yaxis_title=label,
         margin=dict(l=20, r=20, t=30, b=20),
         paper_bgcolor="rgba(0,0,0,0)",
         plot_bgcolor="rgba(0,0,0,0)",
@@ -155,14 +193,63 @@ def plot_line(series, label, height=280):
 
 
 # ----------------------------
-# Warm-Up FastAPI Thread
+# HTML Helpers (CoinGecko strings are untrusted)
+# ----------------------------
+def _esc(value):
+    return html.escape(str(value), quote=True)
+
+def _http_url(urls):
+    """First entry of a CoinGecko URL list, only if it is an http(s) link"""
+    url = (urls or [""])[0] if isinstance(urls, list) else urls
+    return url if isinstance(url, str) and url.startswith("http") else None
+
+
+# ----------------------------
+# Cache Warm-Up (once per process)
+# ----------------------------
+def warm_caches():
+    """Fill the CoinGecko and FastAPI caches shared by all sessions"""
+    get_live_market()
+    get_ohlc(90)
+    get_market_chart(90)
+    get_metadata()
+    # last, so a cold FastAPI instance cannot hold up the CoinGecko warm-up
+    _prediction_or_none(date.today().isoformat())
+
+@st.cache_resource(show_spinner=False)
+def start_warmup():
+    """Run warm_caches in a daemon thread, at most once per server process"""
+    t = threading.Thread(target=warm_caches, daemon=True)
+    t.start()
+    return t
+
+
+def _preload_plotting():
+    """Import the charting stack in the background after first paint"""
+    import numpy, plotly.graph_objects  # noqa: F401
+
+@st.cache_resource(show_spinner=False)
+def _start_plotting_preload():
+    """Run _preload_plotting in a daemon thread, at most once per server process"""
+    t = threading.Thread(target=_preload_plotting, daemon=True)
+    t.start()
+    return t
+
+
+# ----------------------------
+# GC Pause While Building Figures
 # ----------------------------
-def _warm_fastapi():
-    """Ping the FastAPI once to wake up Render server"""
+@contextmanager
+def _gc_paused():
+    """Suspend automatic GC around CPU-bound figure building"""
+    was_enabled = gc.isenabled()
+    gc.disable()
     try:
-        requests.get(f"{FASTAPI}/predict/ethereum?date={date.today().isoformat()}", timeout=10)
-    except:
-        pass
+        yield
+    finally:
+        # only the caller that disabled GC turns it back on (concurrent sessions)
+        if was_enabled:
+            gc.enable()
 
 
 # ----------------------------
@@ -170,39 +257,60 @@ def _warm_fastapi():
 # ----------------------------
 def app():
     _inject_theme()
-    threading.Thread(target=_warm_fastapi, daemon=True).start()
 
     st.markdown("<h1 class='heading-yellow'>Ethereum Next-Day High Price Prediction</h1>", unsafe_allow_html=True)
     st.caption("Powered by CoinGecko & FastAPI · AT3 Group 1, UTS 2025")
+    _start_plotting_preload()
 
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
     # ============================================================
-    # SECTION 1 — Prediction via FastAPI
+    # Fetch Sections 1–4 concurrently (independent network I/O)
     # ============================================================
     today = date.today()
-    iframe_url = f"{FASTAPI}/predict/ethereum?date={today.isoformat()}"
-    components.iframe(iframe_url, height=520, scrolling=True)
+    days = 90
+    ctx = get_script_run_ctx()
+    # attach this run's ScriptRunContext to each worker thread
+    ex = ThreadPoolExecutor(
+        max_workers=5,
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+    )
+    fu_pred = ex.submit(_prediction_or_none, today.isoformat())
+    fu_mk = ex.submit(get_live_market)
+    fu_ohlc = ex.submit(get_ohlc, days)
+    fu_chart = ex.submit(get_market_chart, days)
+    fu_meta = ex.submit(get_metadata)
+    ex.shutdown(wait=False)  # queued fetches still run to completion
+
+    # ============================================================
+    # SECTION 1 — Prediction via FastAPI (filled in last, see below)
+    # ============================================================
+    prediction_slot = st.empty()
+    with prediction_slot:
+        st.caption("Loading prediction…")
 
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
+    with st.spinner("Loading market data…"):
+        mk = fu_mk.result()
+        ohlc = fu_ohlc.result()
+        market_chart = fu_chart.result()
+        meta = fu_meta.result()
+
     # ============================================================
     # SECTION 2 — Market Overview KPIs
     # ============================================================
     st.markdown("### Live Market Snapshot")
-    mk = get_live_market()
     if mk and COIN_ID in mk:
         data = mk[COIN_ID]
-        colA, colB, colC, colD = st.columns(4)
         metrics = [
             ("Price (USD)", f"${data.get('usd', 0):,.2f}"),
             ("24h Change (%)", f"{data.get('usd_24h_change', 0):,.2f}%"),
             ("Market Cap (USD)", f"${data.get('usd_market_cap', 0):,.0f}"),
             ("24h Volume (USD)", f"${data.get('usd_24h_vol', 0):,.0f}")
         ]
-        for i, (label, value) in enumerate(metrics):
-            with [colA, colB, colC, colD][i]:
-                st.markdown(f"<div class='kpi'><h3>{label}</h3><p>{value}</p></div>", unsafe_allow_html=True)
+        kpis = "".join(f"<div class='kpi'><h3>{label}</h3><p>{value}</p></div>" for label, value in metrics)
+        st.markdown(f"<div class='kpi-row'>{kpis}</div>", unsafe_allow_html=True)
     else:
         st.info("Data temporarily unavailable — please retry in a moment.")
 
@@ -212,22 +320,22 @@ def app():
     # SECTION 3 — Historical Charts
     # ============================================================
     st.markdown("### Historical Market Performance")
-    days = 90
-    ohlc = get_ohlc(days)
-    market_chart = get_market_chart(days)
+    with _gc_paused():
+        fig_candle = plot_candlestick(ohlc)
+        line_figs = [
+            plot_line(market_chart[key], label)
+            for key, label in [("market_caps", "Market Cap (USD)"), ("total_volumes", "Trading Volume (USD)")]
+            if market_chart and market_chart.get(key)
+        ]
 
-    fig_candle = plot_candlestick(ohlc)
     if fig_candle:
-        st.plotly_chart(fig_candle, use_container_width=True)
+        st.plotly_chart(fig_candle, use_container_width=True, config=PLOTLY_CONFIG)
     else:
         st.info("Price history unavailable right now.")
 
-    if market_chart:
-        for key, label in [("market_caps", "Market Cap (USD)"), ("total_volumes", "Trading Volume (USD)")]:
-            if market_chart.get(key):
-                fig = plot_line(market_chart[key], label)
-                if fig:
-                    st.plotly_chart(fig, use_container_width=True)
+    for fig in line_figs:
+        if fig:
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
     st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
@@ -235,14 +343,24 @@ def app():
     # SECTION 4 — Project Fundamentals
     # ============================================================
     st.markdown("### Ethereum Fundamentals")
-    meta = get_metadata()
     if meta:
-        logo = meta["image"]["large"]
-        st.markdown(f"<img src='{logo}' width='80'>", unsafe_allow_html=True)
-        st.markdown(f"**Name:** {meta['name']}  |  **Symbol:** {meta['symbol'].upper()}")
-        st.markdown(f"**Algorithm:** {meta.get('hashing_algorithm','N/A')}")
-        st.markdown(f"**Category:** {', '.join(meta.get('categories', []))}")
-        st.markdown(f"[Website]({meta['links']['homepage'][0]}) | [Explorer]({meta['links']['blockchain_site'][0]})")
+        logo = _http_url(meta.get("image", {}).get("large"))
+        links = meta.get("links", {})
+        anchors = [
+            f"<a href='{_esc(url)}'>{text}</a>"
+            for url, text in [(_http_url(links.get("homepage")), "Website"),
+                              (_http_url(links.get("blockchain_site")), "Explorer")]
+            if url
+        ]
+        fundamentals = (
+            (f"<img src='{_esc(logo)}' width='80'>" if logo else "")
+            + f"<p><b>Name:</b> {_esc(meta.get('name', ''))}  |  "
+            f"<b>Symbol:</b> {_esc(meta.get('symbol', '').upper())}</p>"
+            f"<p><b>Algorithm:</b> {_esc(meta.get('hashing_algorithm') or 'N/A')}</p>"
+            f"<p><b>Category:</b> {_esc(', '.join(c for c in meta.get('categories', []) if c))}</p>"
+            + (f"<p>{' | '.join(anchors)}</p>" if anchors else "")
+        )
+        st.markdown(fundamentals, unsafe_allow_html=True)
     else:
         st.info("Project fundamentals unavailable — please refresh later.")
 
@@ -260,3 +378,16 @@ def app():
     - Automatic retry and warm-up for stable performance  
     """)
     st.caption("Developed by Twinkle · AT3 Group 1 · University of Technology Sydney (2025)")
+
+    # ============================================================
+    # SECTION 1 — filled last so a cold FastAPI never blocks Sections 2–5
+    # ============================================================
+    pred = fu_pred.result()
+    with prediction_slot.container():
+        if isinstance(pred, dict) and isinstance(pred.get("prediction"), (int, float)):
+            st.metric("Predicted Next-Day High (USD)", f"${pred['prediction']:,.2f}")
+        elif pred:
+            st.json(pred)
+        else:
+            # no JSON (cold start or an HTML response): let the browser load it
+            components.iframe(f"{FASTAPI}/predict/ethereum?date={today.isoformat()}", height=520, scrolling=True)